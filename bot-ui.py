@@ -210,9 +210,12 @@ def deactivateButtons() -> None:
     This function iterates over the last event's bot replies and deactivates any buttons found.
     """
     prevEvent = st.session_state.messages[-1]["content"]
-    for reply in prevEvent.botReply:
+    for i, reply in enumerate(prevEvent.botReply):
         if reply.type == BotMessageTypes.button:
-            reply.payload.active = False
+            # Bot messages are frozen, so swap in a deactivated copy
+            prevEvent.botReply[i] = reply.model_copy(
+                update={"payload": reply.payload.model_copy(update={"active": False})}
+            )
     st.session_state.messages[-1]["content"] = prevEvent
 
 
@@ -401,7 +404,7 @@ if __name__ == "__main__":
         else:
             with st.chat_message("user"):
                 logger.debug("Writing user message to chat...")
-                st.markdown(message["content"].payload["text"])
+                st.markdown(message["content"].payload.text)
     if st.session_state.messages[-1]["role"] != "assistant":
         logger.debug("Processing user input...")
         with st.chat_message("assistant") as msg:
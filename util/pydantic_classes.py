@@ -1,8 +1,25 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 from datetime import datetime, timezone
-from nanoid import generate
-from typing import List, Dict, Any, Union
+from os import urandom
+from typing import List, Literal, Union
+
+# nanoid's default alphabet has exactly 64 symbols, so masking a random byte
+# with 63 picks a symbol uniformly without nanoid's rejection sampling loop
+_ID_ALPHABET = "_-0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _generate_id(size: int) -> str:
+    """Generate a random nanoid-compatible ID of the given size."""
+    return "".join([_ID_ALPHABET[b & 63] for b in urandom(size)])
+
+
+_UTC = timezone.utc
+
+
+def _utcnow() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+    return datetime.now(_UTC)
 
 
 class Choice(BaseModel):
@@ -14,6 +31,8 @@ class Choice(BaseModel):
         value (str): Actual value of the choice.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     label: str = Field("", description="Display label for the choice")
     value: str = Field("", description="Actual value of the choice")
 
@@ -25,13 +44,19 @@ class BotButtonMessage(BaseModel):
     Attributes:
         text (str): Text to display above the buttons.
         choices (List[Choice]): List of choices for agent reply.
+        kind (Literal["button"]): Tag used to pick the payload model.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     text: str = Field("", description="Text to show to the user above the buttons")
     choices: List[Choice] = Field(..., description="List of choices for agent reply")
     active: bool = Field(
         True, description="Whether or not the button should be clickable"
     )
+    kind: Literal["button"] = Field(
+        "button", description="Tag used to pick the payload model"
+    )
 
 
 class BotDropdownMessage(BaseModel):
@@ -41,13 +66,19 @@ class BotDropdownMessage(BaseModel):
     Attributes:
         text (str): Text to display above the dropdown.
         choices (List[Choice]): List of choices for agent reply.
+        kind (Literal["dropdown"]): Tag used to pick the payload model.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     text: str = Field("", description="Text to show to the user above the dropdown")
     choices: List[Choice] = Field([], description="List of choices for agent reply")
     active: bool = Field(
         True, description="Whether or not the button should be clickable"
     )
+    kind: Literal["dropdown"] = Field(
+        "dropdown", description="Tag used to pick the payload model"
+    )
 
 
 class BotHTMLMessage(BaseModel):
@@ -56,9 +87,15 @@ class BotHTMLMessage(BaseModel):
 
     Attributes:
         html (str): HTML string to be rendered for the user.
+        kind (Literal["html"]): Tag used to pick the payload model.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     html: str = Field("", description="A string of HTML to be rendered for the user")
+    kind: Literal["html"] = Field(
+        "html", description="Tag used to pick the payload model"
+    )
 
 
 class BotImageMessage(BaseModel):
@@ -67,9 +104,15 @@ class BotImageMessage(BaseModel):
 
     Attributes:
         url (str): The hosted URL of the image.
+        kind (Literal["image"]): Tag used to pick the payload model.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     url: str = Field("", description="The image's hosted URL")
+    kind: Literal["image"] = Field(
+        "image", description="Tag used to pick the payload model"
+    )
 
 
 class BotTextMessage(BaseModel):
@@ -79,14 +122,20 @@ class BotTextMessage(BaseModel):
     Attributes:
         text (str): Text message content.
         useMarkdown (bool): Flag to determine if text should be rendered using markdown.
+        kind (Literal["text"]): Tag used to pick the payload model.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     text: str = Field(
         "Hello World", description="A basic text message sent to the user"
     )
     useMarkdown: bool = Field(
         True, description="Whether or not to render text using markdown"
     )
+    kind: Literal["text"] = Field(
+        "text", description="Tag used to pick the payload model"
+    )
 
 
 class BotMessageTypes(Enum):
@@ -119,10 +168,16 @@ class BotMessage(BaseModel):
         payload (BotPayload): Actual message content/data.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     type: BotMessageTypes = Field(
-        "text", description="What type of message is being sent"
+        BotMessageTypes.text, description="What type of message is being sent"
+    )
+    payload: BotPayload = Field(
+        default_factory=BotTextMessage,
+        discriminator="kind",
+        description="The message being send",
     )
-    payload: BotPayload = Field("Hello World", description="The message being send")
 
 
 class Directions(Enum):
@@ -134,6 +189,19 @@ class Directions(Enum):
     outgoing = "outgoing"
 
 
+class EventPayload(BaseModel):
+    """
+    Represents the user input carried by an event.
+
+    Attributes:
+        type (str): How the input was given, e.g. "text" or "button".
+        text (str): The text to be processed.
+    """
+
+    type: str = Field("", description="How the input was given")
+    text: str = Field("", description="The text to be processed")
+
+
 class Event(BaseModel):
     """
     The base object that gets passed around all the services, capturing event details and context.
@@ -144,24 +212,24 @@ class Event(BaseModel):
         id (str): A unique identifier for this event.
         sentOn (datetime): Timestamp when the event was sent.
         direction (Directions): Direction of the event (either incoming or outgoing).
-        payload (Dict[str, Any]): Payload containing the text to be processed.
+        payload (EventPayload): Payload containing the text to be processed.
         botReply (List[BotMessage]): Agent's replies to the user.
     """
 
     @staticmethod
     def gen_userId():
         """Generate a unique user ID."""
-        return generate(size=12)
+        return _generate_id(12)
 
     @staticmethod
     def gen_convId():
         """Generate a unique conversation ID."""
-        return generate(size=14)
+        return _generate_id(14)
 
     @staticmethod
     def gen_eventId():
         """Generate a unique event ID."""
-        return generate(size=18)
+        return _generate_id(18)
 
 
     userId: str = Field(
@@ -175,19 +243,15 @@ class Event(BaseModel):
         default_factory=gen_eventId, description="A unique identifier for this event"
     )
     sentOn: datetime = Field(
-        default_factory=datetime.utcnow, description="Datetime when the event was sent"
+        default_factory=_utcnow, description="Datetime when the event was sent"
     )
     direction: Directions = Field(
-        "incoming", description="Direction of the event - incoming or outgoing"
+        Directions.incoming,
+        description="Direction of the event - incoming or outgoing",
     )
-    payload: Dict[str, Any] = Field(
-        {}, description="Payload containing the text to be processed"
+    payload: EventPayload = Field(
+        default_factory=EventPayload,
+        description="Payload containing the text to be processed",
     )
     botReply: List[BotMessage] = Field([], description="Agent's replies to the user")
 
-    class Config:
-        """Configuration for JSON serialization."""
-
-        json_encoders = {
-            datetime: lambda dt: dt.astimezone(timezone.utc).isoformat(),
-        }
\ No newline at end of file